@@ -0,0 +1,24 @@
+"""Gunicorn settings, picked up automatically when gunicorn starts in this directory.
+
+PRELOAD_APP=1 (default) imports release_scheduler_v2 once in the master and warms
+it there, so every worker forks from an already-warm copy. PRELOAD_APP=0 loads
+the app in each worker, which then warms itself before serving. WARMUP=0 skips
+the warm-up in both modes.
+"""
+import os
+
+preload_app = os.environ.get('PRELOAD_APP', '1') == '1'
+warmup = os.environ.get('WARMUP', '1') == '1'
+
+
+def on_starting(server):
+    # With preload_app the app module is already imported here, before any fork
+    if preload_app and warmup:
+        import release_scheduler_v2
+        release_scheduler_v2.warm_up()
+
+
+def post_worker_init(worker):
+    if not preload_app and warmup:
+        import release_scheduler_v2
+        release_scheduler_v2.warm_up()
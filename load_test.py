@@ -0,0 +1,503 @@
+"""Offline load test for the Dash callback endpoints of release_scheduler_v2.
+
+Starts the app under gunicorn on a local port (or targets --url), replays
+/_dash-update-component payloads for the upload, filter, toggle and
+expand-all flows at a given concurrency, and reports throughput, latency
+percentiles and error rates per callback.
+
+Examples:
+    python load_test.py --concurrency 8 --duration 30
+    python load_test.py --workers 1,2,4 --worker-class sync,gthread --threads 4
+    python load_test.py --aha-csv aha.csv --tickets-csv tickets.csv --record payloads.json
+    python load_test.py --payloads payloads.json --url http://127.0.0.1:8052
+
+Payloads are built from the server's /_dash-dependencies and either the given
+CSVs or a synthetic export (--goals/--rows/--tickets): each step is run once
+against the server, and its outputs become the store values later steps send,
+as in the browser. --record writes them to a JSON file
+({"flows": {flow: [[[callback, body], ...], ...]}}); --payloads replays such a
+file as-is, e.g. one edited from requests captured in the browser.
+
+A callback counts as failed on an HTTP error (e.g. 413 for an oversized
+request), a response that is not JSON, or outputs carrying the app's error
+figure or status text, which it returns with HTTP 200.
+"""
+import argparse
+import base64
+import csv
+import io
+import itertools
+import json
+import math
+import os
+import random
+import socket
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+
+FLOWS = ['upload', 'filter', 'toggle', 'expand-all']
+UPDATE_PATH = '/_dash-update-component'
+
+
+def synthetic_aha_csv(goals, rows, seed=0):
+    """AHA export with `goals` assignees and about `rows` schedule phases"""
+    rng = random.Random(seed)
+    letters = 'ABCDEFGHJKLMNOPQTUVWXYZ'
+    initials = [a + b for a, b in itertools.product(letters, letters)][:goals]
+    out = io.StringIO()
+    writer = csv.writer(out)
+    writer.writerow(['Goal name', 'Schedule name', 'Schedule phase name', 'Schedule phase start', 'Schedule phase end'])
+    writer.writerow(['Company', 'Company Holidays', 'Winter break', '2025-12-24', '2026-01-01'])
+    for i in range(rows):
+        goal = f"I-{initials[i % goals]}"
+        start = date(2025, 7, 1) + timedelta(days=rng.randrange(540))
+        end = start + timedelta(days=rng.randrange(2, 45))
+        if rng.random() < 0.15:
+            writer.writerow([goal, f"{goal[2:]} FTO & Workload", 'FTO - vacation', start, end])
+        else:
+            writer.writerow([goal, f"Release {i % 40}", f"Phase {i % 3 + 1}", start, end])
+    return out.getvalue(), [f"I-{i}" for i in initials]
+
+
+def synthetic_tickets_csv(goals, tickets, seed=0):
+    """Zendesk export with tickets assigned to the synthetic goals' initials"""
+    rng = random.Random(seed)
+    out = io.StringIO()
+    writer = csv.writer(out)
+    writer.writerow(['ID', 'Subject', 'Assignee', 'Status', 'Requested', 'Due date'])
+    for i in range(tickets):
+        initials = goals[i % len(goals)][2:]
+        requested = date(2025, 9, 1) + timedelta(days=rng.randrange(300))
+        due = requested + timedelta(days=rng.randrange(1, 30))
+        writer.writerow([10000 + i, f"Synthetic request {i}", f"{initials[0]}ana {initials[1]}ole",
+                         rng.choice(['Open', 'Pending', 'On-hold']), requested, due])
+    return out.getvalue()
+
+
+def upload_contents(csv_text):
+    return 'data:text/csv;base64,' + base64.b64encode(csv_text.encode('utf-8')).decode('ascii')
+
+
+def post_json(url, body, timeout):
+    data = json.dumps(body).encode('utf-8')
+    req = urllib.request.Request(url, data=data, headers={'Content-Type': 'application/json'})
+    with urllib.request.urlopen(req, timeout=timeout) as resp:
+        return resp.status, resp.read()
+
+
+def get(url, timeout):
+    with urllib.request.urlopen(url, timeout=timeout) as resp:
+        return resp.status, resp.read()
+
+
+def parse_outputs(output):
+    """Split a dependency output string into the body's outputs value
+
+    Like the browser, drop the `@hash` suffix of allow_duplicate outputs.
+    """
+    def spec(text):
+        component_id, prop = text.rsplit('.', 1)
+        return {'id': component_id, 'property': prop.split('@')[0]}
+
+    if output.startswith('..'):
+        return [spec(s) for s in output[2:-2].split('...')]
+    return spec(output)
+
+
+def find_dependency(deps, input_prop=None, output_prop=None):
+    """First callback with an input and an output whose `id.property` contain the given texts"""
+    for dep in deps:
+        if output_prop and output_prop not in dep['output']:
+            continue
+        if input_prop and not any(input_prop in f"{i['id']}.{i['property']}" for i in dep['inputs']):
+            continue
+        return dep
+    raise LookupError(f"No callback found for {input_prop or ''} -> {output_prop or ''}")
+
+
+def layout_values(node, values):
+    """Collect the initial `id.property` values of the components in a layout"""
+    if isinstance(node, list):
+        for child in node:
+            layout_values(child, values)
+    elif isinstance(node, dict) and isinstance(node.get('props'), dict):
+        props = node['props']
+        if isinstance(props.get('id'), str):
+            for prop, value in props.items():
+                if prop not in ('id', 'children'):
+                    values[f"{props['id']}.{prop}"] = value
+        layout_values(props.get('children'), values)
+    return values
+
+
+def output_error(value):
+    """Error text in a callback output: a "❌ Error" status or an "Error:" message Div"""
+    if isinstance(value, dict) and value.get('type') == 'Div':
+        value = value.get('props', {}).get('children')
+    if isinstance(value, str) and (value.startswith('❌ Error') or value.startswith('Error:')):
+        return value
+    return None
+
+
+def response_error(status, raw):
+    """Why a callback response counts as failed ('non-json', 'callback'), or None
+
+    The app's callbacks catch their exceptions and answer 200 with an error
+    figure or status text, so the outputs are checked, not just the status.
+    """
+    if status == 204:
+        return None
+    try:
+        response = json.loads(raw)['response']
+    except (ValueError, KeyError, TypeError):
+        return 'non-json'
+    for props in response.values():
+        if any(output_error(value) for value in props.values()):
+            return 'callback'
+    return None
+
+
+def callback_body(dep, values, changed):
+    """Request body for `dep` with values keyed by `id.property`
+
+    Pattern-matching (ALL) inputs take a list of (id dict, value) pairs.
+    """
+    def resolve(specs):
+        resolved = []
+        for spec in specs:
+            if spec['id'].startswith('{'):
+                pattern = json.loads(spec['id'])
+                items = values.get(pattern['type'], [])
+                resolved.append([{'id': i, 'property': spec['property'], 'value': v} for i, v in items])
+            else:
+                key = f"{spec['id']}.{spec['property']}"
+                resolved.append({'id': spec['id'], 'property': spec['property'], 'value': values.get(key)})
+        return resolved
+
+    return {
+        'output': dep['output'],
+        'outputs': parse_outputs(dep['output']),
+        'inputs': resolve(dep['inputs']),
+        'state': resolve(dep.get('state', [])),
+        'changedPropIds': changed,
+    }
+
+
+def build_flows(base_url, aha_csv, tickets_csv, timeout):
+    """Synthesize one or more step sequences per flow against a running server
+
+    Every step is run once while building, in the order the browser fires the
+    callbacks, and its outputs update the values later steps send. Each flow
+    sequence starts from the state the upload flow leaves behind.
+    """
+    _, raw = get(base_url + '/_dash-dependencies', timeout)
+    deps = json.loads(raw)
+    _, raw = get(base_url + '/_dash-layout', timeout)
+    initial = layout_values(json.loads(raw), {})
+
+    callbacks = {
+        'update_scheduler_data': find_dependency(deps, input_prop='upload-aha-data.contents'),
+        'update_tickets_data': find_dependency(deps, input_prop='upload-tickets-data.contents'),
+        'update_next_openings': find_dependency(deps, 'scheduler-data-store.data', 'next-openings-display.children'),
+        'init_goal_filter': find_dependency(deps, 'scheduler-data-store.data', 'goal-filter-dropdown.options'),
+        'init_visible_goals': find_dependency(deps, 'scheduler-data-store.data', 'visible-goals-store.data'),
+        'auto_collapse_non_top_openings': find_dependency(deps, input_prop='next-openings-goals-store.data'),
+        'update_chart': find_dependency(deps, output_prop='gantt-chart.figure'),
+        'toggle_btn': find_dependency(deps, input_prop='"goal-toggle-btn"}.n_clicks'),
+        'expand_all': find_dependency(deps, input_prop='expand-all-btn.n_clicks'),
+        'collapse_all': find_dependency(deps, input_prop='collapse-all-btn.n_clicks'),
+    }
+
+    def run(steps, values, name, changed, **overrides):
+        """Send one step, record it, and apply its outputs to `values`"""
+        values.update(overrides)
+        body = callback_body(callbacks[name], values, changed)
+        status, raw = post_json(base_url + UPDATE_PATH, body, timeout)
+        error = response_error(status, raw)
+        if error:
+            detail = raw[:200].decode('utf-8', 'replace') if error == 'non-json' else raw.decode('utf-8')
+            raise SystemExit(f"{name} failed while building payloads ({error}): {detail[:500]}")
+        if status != 204:
+            for component_id, props in json.loads(raw)['response'].items():
+                for prop, value in props.items():
+                    values[f"{component_id}.{prop}"] = value
+        steps.append([name, body])
+
+    # Upload: the AHA store feeds openings, the goal filter and the visible
+    # goals; the chart renders once the visible goals are set and again when
+    # auto-collapse expands the top openings; then the tickets upload re-renders
+    values = dict(initial)
+    upload = []
+    run(upload, values, 'update_scheduler_data', ['upload-aha-data.contents'], **{
+        'upload-aha-data.contents': upload_contents(aha_csv),
+        'upload-aha-data.filename': 'aha.csv',
+    })
+    run(upload, values, 'update_next_openings', ['scheduler-data-store.data'])
+    run(upload, values, 'init_goal_filter', ['scheduler-data-store.data'])
+    run(upload, values, 'init_visible_goals', ['scheduler-data-store.data'])
+    run(upload, values, 'update_chart', ['scheduler-data-store.data', 'visible-goals-store.data'])
+    run(upload, values, 'auto_collapse_non_top_openings', ['next-openings-goals-store.data'])
+    run(upload, values, 'update_chart', ['expanded-goals-store.data'])
+    if tickets_csv:
+        run(upload, values, 'update_tickets_data', ['upload-tickets-data.contents'], **{
+            'upload-tickets-data.contents': upload_contents(tickets_csv),
+            'upload-tickets-data.filename': 'tickets.csv',
+        })
+        run(upload, values, 'update_chart', ['tickets-data-store.data'])
+
+    # What the browser shows after the upload: filter options and toggle buttons
+    filter_goals = [o['value'] for o in values['goal-filter-dropdown.options'] if o['value'] != 'All']
+    buttons = (values.get('goal-toggle-buttons.children') or {}).get('props', {}).get('children') or []
+    button_ids = [b['props']['id'] for b in buttons]
+    values['goal-toggle-btn'] = [(i, 0) for i in button_ids]
+
+    flows = {'upload': [upload], 'filter': [], 'toggle': [], 'expand-all': []}
+    for goal in filter_goals:
+        steps = []
+        run(steps, dict(values), 'update_chart', ['goal-filter-dropdown.value'], **{'goal-filter-dropdown.value': goal})
+        flows['filter'].append(steps)
+
+    for button_id in button_ids:
+        steps, step_values = [], dict(values)
+        clicked = json.dumps(button_id, sort_keys=True, separators=(',', ':')) + '.n_clicks'
+        run(steps, step_values, 'toggle_btn', [clicked],
+            **{'goal-toggle-btn': [(i, 1 if i == button_id else 0) for i in button_ids]})
+        run(steps, step_values, 'update_chart', ['expanded-goals-store.data'])
+        flows['toggle'].append(steps)
+
+    steps, step_values = [], dict(values)
+    run(steps, step_values, 'expand_all', ['expand-all-btn.n_clicks'], **{'expand-all-btn.n_clicks': 1})
+    run(steps, step_values, 'update_chart', ['expanded-goals-store.data'])
+    run(steps, step_values, 'collapse_all', ['collapse-all-btn.n_clicks'], **{'collapse-all-btn.n_clicks': 1})
+    run(steps, step_values, 'update_chart', ['expanded-goals-store.data'])
+    flows['expand-all'].append(steps)
+    return flows
+
+
+class Results:
+    """Thread-safe latency samples and error counts by kind per callback"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.latencies = {}
+        self.errors = {}
+
+    def add(self, name, seconds, error=None):
+        with self.lock:
+            self.latencies.setdefault(name, []).append(seconds)
+            if error:
+                kinds = self.errors.setdefault(name, {})
+                kinds[error] = kinds.get(error, 0) + 1
+
+    def summary(self, elapsed):
+        rows = []
+        for name, samples in sorted(self.latencies.items()):
+            samples = sorted(samples)
+            count = len(samples)
+            kinds = self.errors.get(name, {})
+            errors = sum(kinds.values())
+            rows.append({
+                'callback': name,
+                'requests': count,
+                'errors': errors,
+                'error_kinds': dict(sorted(kinds.items())),
+                'error_rate': errors / count,
+                'throughput': count / elapsed,
+                'p50_ms': percentile(samples, 50) * 1000,
+                'p90_ms': percentile(samples, 90) * 1000,
+                'p95_ms': percentile(samples, 95) * 1000,
+                'p99_ms': percentile(samples, 99) * 1000,
+                'max_ms': samples[-1] * 1000,
+            })
+        return rows
+
+
+def percentile(sorted_samples, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    rank = math.ceil(pct / 100 * len(sorted_samples))
+    return sorted_samples[max(0, min(len(sorted_samples), rank) - 1)]
+
+
+def run_load(base_url, flows, selected, concurrency, duration, iterations, timeout):
+    """Replay the selected flows from `concurrency` simulated planners
+
+    Each round runs every selected flow once, taking the next of that flow's
+    sequences, so flows are weighted equally however many variants they have.
+    `iterations` counts rounds per planner; with a duration, planners finish
+    the round in progress when time runs out.
+    """
+    selected_flows = [flows[name] for name in selected if flows.get(name)]
+    missing = [name for name in selected if not flows.get(name)]
+    if missing:
+        raise SystemExit(f"No payloads for flows: {missing}")
+    results = Results()
+    deadline = time.perf_counter() + duration
+
+    def planner(worker_id):
+        for done in itertools.count():
+            if (iterations and done >= iterations) or (not iterations and time.perf_counter() >= deadline):
+                return
+            for sequences in selected_flows:
+                for name, body in sequences[(worker_id + done) % len(sequences)]:
+                    started = time.perf_counter()
+                    try:
+                        status, raw = post_json(base_url + UPDATE_PATH, body, timeout)
+                        error = response_error(status, raw)
+                    except urllib.error.HTTPError as e:
+                        error = f"http {e.code}"
+                    except (urllib.error.URLError, OSError):
+                        error = 'network'
+                    results.add(name, time.perf_counter() - started, error)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(planner, range(concurrency)))
+    return results.summary(time.perf_counter() - started)
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def start_server(workers, worker_class, threads, extra_env, timeout=60):
+    """Start gunicorn on a free local port and wait until it serves the layout"""
+    port = free_port()
+    env = dict(os.environ, **extra_env)
+    cmd = [sys.executable, '-m', 'gunicorn', 'release_scheduler_v2:server',
+           '--bind', f'127.0.0.1:{port}', '--workers', str(workers),
+           '--worker-class', worker_class, '--threads', str(threads), '--log-level', 'warning']
+    proc = subprocess.Popen(cmd, cwd=os.path.dirname(os.path.abspath(__file__)), env=env)
+    base_url = f'http://127.0.0.1:{port}'
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if proc.poll() is not None:
+            raise SystemExit(f"gunicorn exited with code {proc.returncode}")
+        try:
+            get(base_url + '/_dash-layout', 2)
+            return proc, base_url
+        except (urllib.error.URLError, OSError):
+            time.sleep(0.25)
+    proc.terminate()
+    raise SystemExit(f"gunicorn did not start within {timeout}s")
+
+
+def stop_server(proc):
+    proc.terminate()
+    try:
+        proc.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+
+
+def print_table(title, rows):
+    print(f"\n{title}")
+    print(f"{'callback':<32}{'reqs':>7}{'err%':>7}{'req/s':>9}{'p50':>9}{'p90':>9}{'p95':>9}{'p99':>9}{'max':>9}")
+    for r in rows:
+        print(f"{r['callback']:<32}{r['requests']:>7}{r['error_rate'] * 100:>6.1f}%{r['throughput']:>9.1f}"
+              f"{r['p50_ms']:>9.0f}{r['p90_ms']:>9.0f}{r['p95_ms']:>9.0f}{r['p99_ms']:>9.0f}{r['max_ms']:>9.0f}")
+    for r in rows:
+        if r['errors']:
+            kinds = ', '.join(f"{kind}: {n}" for kind, n in r['error_kinds'].items())
+            print(f"  {r['callback']} errors - {kinds}")
+
+
+def parse_env(pairs):
+    env = {}
+    for pair in pairs:
+        key, _, value = pair.partition('=')
+        env[key] = value
+    return env
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--url', help='Target an already running server instead of starting gunicorn')
+    parser.add_argument('--workers', default='1', help='Comma-separated gunicorn worker counts to compare')
+    parser.add_argument('--worker-class', default='sync', help='Comma-separated gunicorn worker classes to compare')
+    parser.add_argument('--threads', type=int, default=1, help='Threads per worker (gthread)')
+    parser.add_argument('--env', action='append', default=[], metavar='KEY=VALUE', help='Extra environment for the server')
+    parser.add_argument('--flows', default=','.join(FLOWS), help=f'Comma-separated flows from {FLOWS}')
+    parser.add_argument('--concurrency', type=int, default=4, help='Simulated concurrent planners')
+    parser.add_argument('--duration', type=float, default=20, help='Seconds per run')
+    parser.add_argument('--iterations', type=int, default=0, help='Rounds of all selected flows per planner (overrides --duration)')
+    parser.add_argument('--timeout', type=float, default=60, help='Per-request timeout in seconds')
+    parser.add_argument('--aha-csv', help='AHA export to upload (default: synthetic)')
+    parser.add_argument('--tickets-csv', help='Zendesk export to upload (default: synthetic)')
+    parser.add_argument('--goals', type=int, default=12, help='Synthetic goals')
+    parser.add_argument('--rows', type=int, default=400, help='Synthetic schedule phases')
+    parser.add_argument('--tickets', type=int, default=200, help='Synthetic tickets')
+    parser.add_argument('--payloads', help='Replay payloads from this JSON file')
+    parser.add_argument('--record', help='Write the synthesized payloads to this JSON file')
+    parser.add_argument('--json', help='Write results to this JSON file')
+    args = parser.parse_args(argv)
+
+    if args.aha_csv:
+        with open(args.aha_csv, encoding='utf-8') as f:
+            aha_csv = f.read()
+    else:
+        aha_csv, synthetic_goals = synthetic_aha_csv(args.goals, args.rows)
+    if args.tickets_csv:
+        with open(args.tickets_csv, encoding='utf-8') as f:
+            tickets_csv = f.read()
+    elif args.aha_csv:
+        tickets_csv = None
+    else:
+        tickets_csv = synthetic_tickets_csv(synthetic_goals, args.tickets)
+
+    recorded = None
+    if args.payloads:
+        with open(args.payloads, encoding='utf-8') as f:
+            recorded = json.load(f)['flows']
+
+    selected = [f.strip() for f in args.flows.split(',') if f.strip()]
+    if args.url:
+        configs = [(None, None)]
+    else:
+        configs = [(int(w), c) for w in args.workers.split(',') for c in args.worker_class.split(',')]
+
+    report = []
+    for workers, worker_class in configs:
+        proc = None
+        if args.url:
+            base_url, title = args.url.rstrip('/'), args.url
+        else:
+            proc, base_url = start_server(workers, worker_class, args.threads, parse_env(args.env))
+            title = f"workers={workers} class={worker_class} threads={args.threads}"
+        try:
+            flows = recorded or build_flows(base_url, aha_csv, tickets_csv, args.timeout)
+            if args.record and not recorded:
+                with open(args.record, 'w', encoding='utf-8') as f:
+                    json.dump({'flows': flows}, f)
+            rows = run_load(base_url, flows, selected, args.concurrency, args.duration, args.iterations, args.timeout)
+        finally:
+            if proc:
+                stop_server(proc)
+        print_table(f"{title}  concurrency={args.concurrency}", rows)
+        report.append({'workers': workers, 'worker_class': worker_class, 'threads': args.threads,
+                       'concurrency': args.concurrency, 'callbacks': rows})
+
+    if len(report) > 1:
+        print(f"\n{'config':<36}{'req/s':>9}{'err%':>7}{'worst p95':>11}")
+        for run in report:
+            total = sum(r['requests'] for r in run['callbacks'])
+            errors = sum(r['errors'] for r in run['callbacks'])
+            throughput = sum(r['throughput'] for r in run['callbacks'])
+            worst_p95 = max(r['p95_ms'] for r in run['callbacks'])
+            name = f"workers={run['workers']} class={run['worker_class']}"
+            print(f"{name:<36}{throughput:>9.1f}{errors / total * 100:>6.1f}%{worst_p95:>11.0f}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
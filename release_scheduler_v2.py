@@ -1,20 +1,96 @@
+import time
+_IMPORT_STARTED = time.perf_counter()
+
+import numpy as np
 import pandas as pd
-import plotly.graph_objects as go
 import dash
 from dash import dcc, html, Input, Output, State, callback, ALL
 import base64
+import hashlib
+import heapq
+import importlib
 import io
+import json
+import math
+import multiprocessing
 import os
+import sys
+import tempfile
+import threading
+import traceback
+import tracemalloc
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import flask
+
+class LazyModule:
+    """Module proxy that imports on first attribute access"""
+    
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+    
+    def __getattr__(self, attr):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+# plotly.graph_objects is only needed once a figure is built; deferring it keeps
+# it out of import time (warm_up loads it before the first request)
+go = LazyModule('plotly.graph_objects')
 
 app = dash.Dash(__name__)
 
 default_csv = "/Users/random/Library/Mobile Documents/com~apple~CloudDocs/Desktop/aha_list_release phases_260116223046.csv"
 default_df = pd.DataFrame()  # Load lazily when needed
 
-def process_scheduler_data(df, end_date=None):
-    """Process and aggregate scheduler data"""
+def to_days(dates):
+    """datetime64[D] array from a Series of timestamps"""
+    if dates.dt.tz is not None:
+        dates = dates.dt.tz_localize(None)
+    return dates.values.astype('datetime64[D]')
+
+def build_business_calendar(df):
+    """Mon-Fri business-day calendar without the days covered by 'Company Holidays' phases"""
+    holidays = df[df['Schedule name'] == 'Company Holidays']
+    starts = to_days(pd.to_datetime(holidays['Schedule phase start']))
+    ends = to_days(pd.to_datetime(holidays['Schedule phase end']))
+    valid = ~(np.isnat(starts) | np.isnat(ends))
+    starts, ends = starts[valid], ends[valid]
+    
+    # Expand every inclusive [start, end] phase into its individual days
+    lengths = np.maximum((ends - starts).astype(int) + 1, 0)
+    offsets = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    days = np.repeat(starts, lengths) + offsets.astype('timedelta64[D]')
+    return np.busdaycalendar(weekmask='1111100', holidays=np.unique(days))
+
+def business_days_between(start, end, calendar):
+    """Working days in [start, end) for two Series of timestamps, NaN where either is missing"""
+    start_days, end_days = to_days(start), to_days(end)
+    valid = ~(np.isnat(start_days) | np.isnat(end_days))
+    counts = np.busday_count(start_days[valid], end_days[valid], busdaycal=calendar)
+    if valid.all():
+        return counts
+    result = np.full(len(start_days), np.nan)
+    result[valid] = counts
+    return result
+
+def business_day_after(dates, n, calendar):
+    """The n-th working day after each date in a Series (NaT stays NaT)"""
+    days = to_days(dates)
+    valid = ~np.isnat(days)
+    result = np.full(len(days), np.datetime64('NaT'), dtype='datetime64[D]')
+    # Rolling backward first makes a weekend/holiday count from the working day before it
+    result[valid] = np.busday_offset(days[valid], n, roll='backward', busdaycal=calendar)
+    return pd.Series(result.astype('datetime64[ns]'), index=dates.index)
+
+def process_scheduler_data(df, end_date=None, calendar=None):
+    """Process and aggregate scheduler data (durations in working days)"""
     df['Schedule phase start'] = pd.to_datetime(df['Schedule phase start'])
     df['Schedule phase end'] = pd.to_datetime(df['Schedule phase end'])
+    if calendar is None:
+        calendar = build_business_calendar(df)
     df = df[df['Schedule name'] != 'Company Holidays'].copy()
     july_2025 = pd.to_datetime('2025-07-01')
     df = df[df['Schedule phase end'] >= july_2025].copy()
@@ -61,7 +137,7 @@ def process_scheduler_data(df, end_date=None):
     # Combine both
     scheduler_df = pd.concat([fto_scheduler, other_scheduler], ignore_index=True)
     
-    scheduler_df['Duration Days'] = (scheduler_df['End Date'] - scheduler_df['Start Date']).dt.days
+    scheduler_df['Duration Days'] = business_days_between(scheduler_df['Start Date'], scheduler_df['End Date'], calendar)
     scheduler_df = scheduler_df.sort_values(['Goal', 'Start Date'])
     
     return scheduler_df
@@ -101,8 +177,31 @@ def process_tickets_data(df):
     
     return df[['Assignee', 'Assignee Initials', 'ID', 'Title', 'RequestedDate', 'DueDate', 'TicketStatus']]
 
-def create_gantt_chart(scheduler_df, expanded_goals=None, visible_goals=None, end_date=None, tickets_df=None):
-    """Create Gantt chart with expand/collapse and goal visibility filtering"""
+def pack_lanes(starts, ends):
+    """Interval partitioning: assign each [start, end] to the fewest non-overlapping lanes
+    
+    Returns (lane per interval in input order, number of lanes) in O(n log n).
+    """
+    order = np.argsort(starts, kind='stable')
+    starts, ends = np.asarray(starts).tolist(), np.asarray(ends).tolist()
+    lanes = np.zeros(len(starts), dtype=int)
+    lane_ends = []  # heap of (end of the lane's last interval, lane)
+    for i in order.tolist():
+        if lane_ends and lane_ends[0][0] < starts[i]:
+            lane = lane_ends[0][1]
+            heapq.heapreplace(lane_ends, (ends[i], lane))
+        else:
+            lane = len(lane_ends)
+            heapq.heappush(lane_ends, (ends[i], lane))
+        lanes[i] = lane
+    return lanes, len(lane_ends)
+
+def create_gantt_chart(scheduler_df, expanded_goals=None, visible_goals=None, end_date=None, tickets_df=None, pack_tickets=False):
+    """Create Gantt chart with expand/collapse and goal visibility filtering
+    
+    With pack_tickets, each goal's tickets share the fewest non-overlapping lanes
+    instead of getting one labelled row each; details stay in the hover.
+    """
     
     if expanded_goals is None:
         expanded_goals = {}
@@ -121,6 +220,7 @@ def create_gantt_chart(scheduler_df, expanded_goals=None, visible_goals=None, en
     tasks = []
     task_data = []
     header_positions = {}
+    packed_tickets = []  # (goal, tickets, row of each ticket) drawn as one bar trace per goal
     y_pos = 0
     
     # Build hierarchical task list
@@ -150,7 +250,17 @@ def create_gantt_chart(scheduler_df, expanded_goals=None, visible_goals=None, en
             # Add tickets for this goal (match by initials)
             goal_initials = goal.replace('I-', '')  # e.g., 'AN' from 'I-AN'
             goal_tickets = tickets_df[tickets_df['Assignee Initials'] == goal_initials].copy() if not tickets_df.empty else pd.DataFrame()
-            if not goal_tickets.empty:
+            if not goal_tickets.empty and pack_tickets:
+                goal_tickets = goal_tickets.dropna(subset=['RequestedDate', 'DueDate'])
+                starts = goal_tickets['RequestedDate'].values.astype('datetime64[ns]').astype('int64')
+                ends = np.maximum(goal_tickets['DueDate'].values.astype('datetime64[ns]').astype('int64'), starts)
+                lanes, n_lanes = pack_lanes(starts, ends)
+                for lane in range(n_lanes):
+                    tasks.append(f"    🎫 Tickets — lane {lane + 1}")
+                    task_data.append(('lane', goal))
+                packed_tickets.append((goal, goal_tickets, y_pos + lanes))
+                y_pos += n_lanes
+            elif not goal_tickets.empty:
                 for idx, row in goal_tickets.iterrows():
                     ticket_label = f"    🎫 #{row['ID']} {row['Title'][:30]}"
                     tasks.append(ticket_label)
@@ -163,7 +273,7 @@ def create_gantt_chart(scheduler_df, expanded_goals=None, visible_goals=None, en
     ticket_colors = {'Open': '#27ae60', 'Pending': '#f39c12', 'On-hold': '#e74c3c'}
     
     for idx, task in enumerate(tasks):
-        if isinstance(task_data[idx], tuple) and task_data[idx][0] != 'header':
+        if isinstance(task_data[idx], tuple) and task_data[idx][0] not in ('header', 'lane'):
             task_tuple = task_data[idx]
             start_date = task_tuple[0]
             end_date = task_tuple[1]
@@ -211,7 +321,7 @@ def create_gantt_chart(scheduler_df, expanded_goals=None, visible_goals=None, en
                         f"<b>{goal_display}</b><br>"
                         f"{schedule}<br>"
                         f"{start_date.strftime('%Y-%m-%d')} → {end_date.strftime('%Y-%m-%d')}<br>"
-                        f"Duration: {duration} days<extra></extra>"
+                        f"Duration: {duration} working days<extra></extra>"
                     )
                 
                 fig.add_trace(go.Scatter(
@@ -224,6 +334,31 @@ def create_gantt_chart(scheduler_df, expanded_goals=None, visible_goals=None, en
                     hoverinfo='text'
                 ))
     
+    # Packed tickets: one horizontal bar trace per goal, bars placed in their lanes
+    for goal, goal_tickets, rows in packed_tickets:
+        if goal not in visible_goals:
+            continue
+        starts = goal_tickets['RequestedDate']
+        durations = (goal_tickets['DueDate'] - starts).clip(lower=pd.Timedelta(days=1))
+        hover_text = (
+            '<b>' + goal_tickets['Title'].astype(str) + '</b><br>Ticket #' + goal_tickets['ID'].astype(str)
+            + '<br>Status: ' + goal_tickets['TicketStatus'].astype(str)
+            + '<br>Requested: ' + starts.dt.strftime('%Y-%m-%d')
+            + '<br>Due: ' + goal_tickets['DueDate'].dt.strftime('%Y-%m-%d')
+        )
+        colors = goal_tickets['TicketStatus'].map(ticket_colors).fillna('#95a5a6')
+        fig.add_trace(go.Bar(
+            x=durations.dt.total_seconds() * 1000,
+            y=rows,
+            base=starts,
+            orientation='h',
+            width=0.5,
+            marker=dict(color=colors.tolist(), opacity=0.7, line=dict(width=0)),
+            hovertext=hover_text.tolist(),
+            hovertemplate='%{hovertext}<extra></extra>',
+            showlegend=False
+        ))
+    
     # Add clickable header bars - larger and easier to click
     x_min = scheduler_df['Start Date'].min()
     x_max = scheduler_df['End Date'].max()
@@ -294,17 +429,19 @@ def create_gantt_chart(scheduler_df, expanded_goals=None, visible_goals=None, en
     
     return fig
 
-def get_next_openings(scheduler_df):
-    """Get the three people with earliest available openings based on last non-FTO schedule + 2 days, 
-    avoiding long PTO periods"""
+def compute_next_openings(scheduler_df, calendar=None):
+    """Return eligible goals sorted by opening date (last non-FTO schedule + 2 working days,
+    pushed past PTO periods longer than 3 working days)"""
     if scheduler_df.empty:
-        return html.Div("No schedules loaded yet.", style={'textAlign': 'center', 'color': '#7f8c8d'})
+        return pd.Series(dtype='datetime64[ns]')
+    if calendar is None:
+        calendar = np.busdaycalendar(weekmask='1111100')
     
     # Exclude FTO & Workload schedules completely from planning
     working_schedules = scheduler_df[scheduler_df['Is_FTO_Workload'] == False].copy()
     
     if working_schedules.empty:
-        return html.Div("No eligible schedules found.", style={'textAlign': 'center', 'color': '#7f8c8d'})
+        return pd.Series(dtype='datetime64[ns]')
     
     # Separate remaining PTO/FTO from other schedules
     pto_schedules = working_schedules[working_schedules['Schedule'].str.contains('FTO', na=False)].copy()
@@ -313,34 +450,40 @@ def get_next_openings(scheduler_df):
     # Get latest end date for each goal from NON-PTO schedules only
     goal_last_dates = non_pto_schedules.groupby('Goal')['End Date'].max()
     
-    # Calculate openings: 2 days after last non-PTO schedule
+    # Calculate openings: 2 working days after last non-PTO schedule
+    opening_dates = business_day_after(goal_last_dates, 2, calendar)
+    
+    # Only PTO longer than 3 working days pushes an opening, to the working day after it
+    long_pto = pto_schedules[pto_schedules['Duration Days'] > 3].copy()
+    long_pto['Day After'] = business_day_after(long_pto['End Date'], 1, calendar)
+    long_pto_by_goal = {goal: goal_pto for goal, goal_pto in long_pto.groupby('Goal')}
+    
     adjusted_openings = {}
-    for goal, last_date in goal_last_dates.items():
-        opening_date = last_date + pd.Timedelta(days=2)
-        
+    for goal, opening_date in opening_dates.items():
         # Check if opening date falls within any PTO period
-        if not pto_schedules.empty:
-            goal_pto = pto_schedules[pto_schedules['Goal'] == goal].copy()
-            
-            for _, pto_row in goal_pto.iterrows():
-                pto_start = pto_row['Start Date']
-                pto_end = pto_row['End Date']
-                pto_duration = (pto_end - pto_start).days
-                
-                # If opening falls within PTO and PTO is > 3 days, push past it
+        if goal in long_pto_by_goal:
+            goal_pto = long_pto_by_goal[goal]
+            for pto_start, pto_end, day_after in zip(goal_pto['Start Date'], goal_pto['End Date'], goal_pto['Day After']):
                 if opening_date >= pto_start and opening_date <= pto_end:
-                    if pto_duration > 3:
-                        opening_date = pto_end + pd.Timedelta(days=1)
+                    opening_date = day_after
         
         adjusted_openings[goal] = opening_date
     
     # Convert to Series and sort
-    goal_openings_series = pd.Series(adjusted_openings)
+    goal_openings_series = pd.Series(adjusted_openings, dtype='datetime64[ns]')
     goal_openings_series = goal_openings_series.sort_values()
     
     # Filter out excluded ones
     excluded = {'AR', 'SD', 'RR', 'BW'}
-    filtered_openings = goal_openings_series[[g.replace('I-', '') not in excluded for g in goal_openings_series.index]]
+    return goal_openings_series[[g.replace('I-', '') not in excluded for g in goal_openings_series.index]]
+
+def get_next_openings(scheduler_df, calendar=None):
+    """Get the three people with earliest available openings based on last non-FTO schedule + 2 working days, 
+    avoiding long PTO periods"""
+    if scheduler_df.empty:
+        return html.Div("No schedules loaded yet.", style={'textAlign': 'center', 'color': '#7f8c8d'})
+    
+    filtered_openings = compute_next_openings(scheduler_df, calendar)
     
     if len(filtered_openings) == 0:
         return html.Div("No eligible schedules found.", style={'textAlign': 'center', 'color': '#7f8c8d'})
@@ -348,9 +491,6 @@ def get_next_openings(scheduler_df):
     # Get top 3 from eligible people
     top_3 = filtered_openings.head(3)
     
-    if len(top_3) == 0:
-        return html.Div("No eligible openings found.", style={'textAlign': 'center', 'color': '#7f8c8d'})
-    
     items = []
     for i, (goal, opening_date) in enumerate(top_3.items(), 1):
         goal_display = goal.replace('I-', '')
@@ -366,9 +506,542 @@ def get_next_openings(scheduler_df):
     
     return html.Div(items, style={'padding': 10})
 
+# Figure cache and background pre-rendering
+# After an upload the likely next chart states (each goal filter, collapse all,
+# expand all, top-3 openings expanded) are built in a separate process pool, so
+# they never compete with request threads for the GIL, and update_chart serves
+# them from the cache instead of rendering on request. Each pool process is a
+# full interpreter (pandas, Dash, plotly) started on a worker's first upload and
+# kept for the worker's lifetime; it is outside the memory budgets below, so it
+# drops its parsed frames after every job.
+FIGURE_CACHE_SIZE = int(os.environ.get('FIGURE_CACHE_SIZE', '32'))
+PRERENDER_WORKERS = int(os.environ.get('PRERENDER_WORKERS', '1'))
+
+_figure_cache = OrderedDict()  # chart cache key -> (update_chart outputs, bytes)
+_figure_cache_capacity = FIGURE_CACHE_SIZE
+# Guards both the figure cache and the dataset cache, which share a memory budget
+_cache_lock = threading.Lock()
+_prerender_lock = threading.Lock()
+_prerender_executor = None
+_prerender_future = None
+
+def data_key(data):
+    """Short content hash of a JSON store value"""
+    if not data:
+        return None
+    return hashlib.sha1(data.encode('utf-8')).hexdigest()
+
+def chart_cache_key(stored_data, selected_goal, visible_goals, expanded_goals, tickets_data, pack_tickets=False):
+    """Cache key for one update_chart state"""
+    if isinstance(visible_goals, dict):
+        visible = tuple(sorted(g for g, v in visible_goals.items() if v))
+    else:
+        visible = None
+    expanded = tuple(sorted((expanded_goals or {}).items()))
+    return (data_key(stored_data), selected_goal or 'All', visible, expanded, data_key(tickets_data), bool(pack_tickets))
+
+def figure_cache_get(key):
+    with _cache_lock:
+        entry = _figure_cache.get(key)
+        if entry is None:
+            return None
+        _figure_cache.move_to_end(key)
+        return entry[0]
+
+def figure_cache_put(key, result):
+    nbytes = estimate_bytes(result[0])
+    with _cache_lock:
+        _figure_cache[key] = (result, nbytes)
+        _figure_cache.move_to_end(key)
+        while len(_figure_cache) > _figure_cache_capacity:
+            _figure_cache.popitem(last=False)
+        evict_over_budget(keep=key)
+
+def schedule_prerender(stored_data, tickets_data):
+    """Queue pre-rendering of the common chart states for an upload (never blocks)"""
+    global _prerender_executor, _prerender_future
+    if PRERENDER_WORKERS <= 0 or not stored_data:
+        return
+    with _prerender_lock:
+        if _prerender_executor is None:
+            # spawn rather than fork: the request process may be running threads
+            _prerender_executor = ProcessPoolExecutor(
+                max_workers=PRERENDER_WORKERS, mp_context=multiprocessing.get_context('spawn')
+            )
+        # Latest upload wins: a job that has not started yet is dropped
+        if _prerender_future is not None:
+            _prerender_future.cancel()
+        future = _prerender_executor.submit(prerender_states, stored_data, tickets_data)
+        _prerender_future = future
+    future.add_done_callback(store_prerendered)
+
+def store_prerendered(future):
+    """Move a finished pre-render job's figures into the figure cache"""
+    global _prerender_executor, _figure_cache_capacity
+    if future.cancelled():
+        return
+    try:
+        results = future.result()
+    except Exception as e:
+        if isinstance(e, BrokenProcessPool):
+            with _prerender_lock:
+                _prerender_executor = None
+        print(f"ERROR in prerender_states: {e}")
+        return
+    
+    # Keep room for every pre-rendered state plus as many interactive ones
+    with _cache_lock:
+        _figure_cache_capacity = max(FIGURE_CACHE_SIZE, 2 * len(results))
+    # Results are ordered least to most likely, so the likeliest are evicted last
+    for key, serialized in results:
+        if figure_cache_get(key) is None:
+            figure_cache_put(key, json.loads(serialized))
+
+def prerender_states(stored_data, tickets_data):
+    """Render the chart states a planner is likely to open next (runs in the pool)
+    
+    Returns [(cache key, JSON-serialized update_chart outputs)], least likely first.
+    """
+    from plotly.io.json import to_json_plotly
+    
+    try:
+        return [(key, to_json_plotly(result)) for key, result in render_likely_states(stored_data, tickets_data)]
+    finally:
+        # The frames were parsed for this job only; don't keep them in the pool process
+        with _cache_lock:
+            _dataset_cache.clear()
+
+def render_likely_states(stored_data, tickets_data):
+    """Yield (cache key, update_chart outputs) for the pre-rendered states, least likely first"""
+    df = load_frame(stored_data)
+    goals = sorted(df['Goal name'].unique())
+    calendar = build_business_calendar(df)
+    scheduler_df = process_scheduler_data(df, end_date=None, calendar=calendar)
+    top_3_goals = compute_next_openings(scheduler_df, calendar).head(3).index.tolist()
+    
+    # Mirror the store values the callbacks produce for each state; only goals
+    # with schedules (not e.g. the holidays goal) get a filter state
+    visible = {g: True for g in goals}
+    top_3_expanded = {g: True for g in top_3_goals}
+    states = [(g, top_3_expanded) for g in sorted(scheduler_df['Goal'].unique())] + [
+        ('All', {g: False for g in goals}),
+        ('All', {g: True for g in goals}),
+        ('All', top_3_expanded),
+    ]
+    
+    for selected_goal, expanded in states:
+        key = chart_cache_key(stored_data, selected_goal, visible, expanded, tickets_data)
+        yield key, render_chart(stored_data, selected_goal, visible, expanded, tickets_data)
+
+# Memory budgets
+# Callback requests over MAX_REQUEST_MB get a 413 before Flask reads the body,
+# uploads are size-checked from their base64 length before decoding, and parsed
+# stores and rendered figures are cached with their in-memory size. Figures,
+# then datasets, are evicted when the caches (or the whole process) go over budget.
+UPLOAD_BUDGET_MB = float(os.environ.get('UPLOAD_BUDGET_MB', '50'))
+UPLOAD_OVERSIZE_ACTION = os.environ.get('UPLOAD_OVERSIZE_ACTION', 'reject')  # 'reject' or 'downsample'
+# An upload request carries the file base64-encoded (4/3 of its size) next to the
+# other store's JSON, and chart requests carry both stores, so allow 4x plus slack
+MAX_REQUEST_MB = float(os.environ.get('MAX_REQUEST_MB', UPLOAD_BUDGET_MB * 4 + 1 if UPLOAD_BUDGET_MB else 0))
+CACHE_BUDGET_MB = float(os.environ.get('CACHE_BUDGET_MB', '128'))
+MEMORY_BUDGET_MB = float(os.environ.get('MEMORY_BUDGET_MB', '0'))  # 0 = no process limit
+
+MB = 1024 * 1024
+
+if os.environ.get('MEMORY_TRACE') == '1' and not tracemalloc.is_tracing():
+    tracemalloc.start()
+
+if MAX_REQUEST_MB:
+    app.server.config['MAX_CONTENT_LENGTH'] = int(MAX_REQUEST_MB * MB)
+
+@app.server.before_request
+def reject_oversized_request():
+    """Answer 413 from the Content-Length header, before the body is read or parsed"""
+    limit = app.server.config.get('MAX_CONTENT_LENGTH')
+    if limit and (flask.request.content_length or 0) > limit:
+        flask.abort(413)
+
+_dataset_cache = OrderedDict()  # data key -> (DataFrame, bytes)
+_rss_after_eviction = None
+
+class Base64Reader(io.RawIOBase):
+    """Readable binary stream that decodes a base64 string a chunk at a time"""
+    
+    def __init__(self, text, start=0, chunk_size=1 << 20):
+        self.text = text
+        self.pos = start
+        self.chunk_size = chunk_size - chunk_size % 4
+        self.buffer = memoryview(b'')
+    
+    def readable(self):
+        return True
+    
+    def readinto(self, b):
+        if not self.buffer and self.pos < len(self.text):
+            chunk = self.text[self.pos:self.pos + self.chunk_size]
+            self.pos += len(chunk)
+            self.buffer = memoryview(base64.b64decode(chunk))
+        n = min(len(b), len(self.buffer))
+        b[:n] = self.buffer[:n]
+        self.buffer = self.buffer[n:]
+        return n
+
+def estimate_upload_bytes(contents, start=0):
+    """Decoded size of a base64 data URL payload, without decoding it"""
+    length = len(contents) - start
+    # Padding is at most two trailing '=' (rstrip would copy the whole payload)
+    padding = contents[-2:].count('=') if length >= 2 else 0
+    return length * 3 // 4 - padding
+
+def read_uploaded_csv(contents):
+    """Parse a dcc.Upload data URL within UPLOAD_BUDGET_MB
+    
+    Returns (DataFrame, note). Oversized uploads raise ValueError, or are read
+    keeping every n-th row when UPLOAD_OVERSIZE_ACTION is 'downsample'.
+    """
+    start = contents.index(',') + 1
+    size = estimate_upload_bytes(contents, start)
+    stream = io.BufferedReader(Base64Reader(contents, start))
+    budget = UPLOAD_BUDGET_MB * MB
+    
+    if not budget or size <= budget:
+        return pd.read_csv(stream, encoding='utf-8'), ''
+    
+    if UPLOAD_OVERSIZE_ACTION != 'downsample':
+        raise ValueError(f'File is {size / MB:.1f} MB, over the {UPLOAD_BUDGET_MB:g} MB upload limit')
+    
+    # Chunk indexes continue across chunks, so the stride is over the whole file
+    stride = math.ceil(size / budget)
+    chunks = pd.read_csv(stream, encoding='utf-8', chunksize=50000)
+    df = pd.concat([chunk[chunk.index % stride == 0] for chunk in chunks], ignore_index=True)
+    return df, f' (downsampled to 1 in {stride} rows, file is {size / MB:.1f} MB)'
+
+def current_memory_bytes():
+    """Traced heap size when tracemalloc is on, otherwise RSS where available"""
+    if tracemalloc.is_tracing():
+        return tracemalloc.get_traced_memory()[0]
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        return None
+
+def estimate_bytes(obj):
+    """Approximate in-memory size of a JSON-like structure of dicts, lists and scalars"""
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(sys.getsizeof(k) + estimate_bytes(v) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple)):
+        size += sum(estimate_bytes(v) for v in obj)
+    return size
+
+def evict_over_budget(keep=None):
+    """Drop least recently used figures, then datasets, until the budgets hold
+    
+    Called with _cache_lock held. The entry under `keep` (just inserted) stays.
+    """
+    global _rss_after_eviction
+    cached = sum(n for _, n in _figure_cache.values()) + sum(n for _, n in _dataset_cache.values())
+    overage = cached - CACHE_BUDGET_MB * MB if CACHE_BUDGET_MB else 0
+    
+    usage = current_memory_bytes() if MEMORY_BUDGET_MB else None
+    if usage is not None:
+        process_overage = usage - MEMORY_BUDGET_MB * MB
+        if process_overage <= 0:
+            _rss_after_eviction = None
+        elif not tracemalloc.is_tracing() and _rss_after_eviction is not None:
+            # RSS rarely shrinks after frees: memory released by the last eviction
+            # is reused first, so only growth beyond that point counts again
+            process_overage = min(process_overage, usage - _rss_after_eviction)
+        overage = max(overage, process_overage)
+    
+    if overage <= 0:
+        return
+    for cache in (_figure_cache, _dataset_cache):
+        for key in list(cache):
+            if overage <= 0:
+                break
+            if key != keep:
+                overage -= cache.pop(key)[1]
+    if usage is not None and not tracemalloc.is_tracing():
+        _rss_after_eviction = usage
+
+def load_frame(data):
+    """Parse a JSON store value, reusing the cached frame for the same data
+    
+    Returns a copy, since the processing functions modify their input.
+    """
+    key = data_key(data)
+    with _cache_lock:
+        entry = _dataset_cache.get(key)
+        if entry is not None:
+            _dataset_cache.move_to_end(key)
+            return entry[0].copy()
+    
+    df = pd.read_json(data, orient='split')
+    nbytes = int(df.memory_usage(index=True, deep=True).sum())
+    with _cache_lock:
+        _dataset_cache[key] = (df, nbytes)
+        evict_over_budget(keep=key)
+    return df.copy()
+
+@app.server.route('/_diagnostics/memory')
+def memory_diagnostics():
+    """Current memory usage, budgets and per-entry cache sizes as JSON"""
+    with _cache_lock:
+        datasets = [{'key': key, 'bytes': nbytes} for key, (_, nbytes) in _dataset_cache.items()]
+        figure_bytes = [nbytes for _, nbytes in _figure_cache.values()]
+    
+    result = {
+        'tracing': tracemalloc.is_tracing(),
+        'current_bytes': current_memory_bytes(),
+        'budgets_mb': {
+            'upload': UPLOAD_BUDGET_MB,
+            'upload_oversize_action': UPLOAD_OVERSIZE_ACTION,
+            'request': MAX_REQUEST_MB,
+            'cache': CACHE_BUDGET_MB,
+            'process': MEMORY_BUDGET_MB,
+        },
+        'datasets': datasets,
+        'datasets_bytes': sum(d['bytes'] for d in datasets),
+        'figure_cache_entries': len(figure_bytes),
+        'figure_cache_bytes': sum(figure_bytes),
+    }
+    
+    if tracemalloc.is_tracing():
+        current, peak = tracemalloc.get_traced_memory()
+        top = flask.request.args.get('top', '10')
+        if not top.isdigit() or int(top) < 1:
+            return flask.jsonify({'error': 'top must be a positive integer'}), 400
+        stats = tracemalloc.take_snapshot().statistics('lineno')[:int(top)]
+        result.update({
+            'traced_current_bytes': current,
+            'traced_peak_bytes': peak,
+            'top_allocations': [
+                {'location': f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+                 'bytes': stat.size, 'count': stat.count}
+                for stat in stats
+            ],
+        })
+    return flask.jsonify(result)
+
+# Read-only query API
+# Each upload saves its session's scheduler and tickets stores together to a file
+# under DATA_DIR, so every worker serves the same latest upload and one planner's
+# AHA file is never paired with another planner's tickets. The file is written by
+# a background thread, one store per line as-is, so the upload callback never
+# waits on the disk. JSON endpoints answer from start- and end-sorted indexes,
+# rebuilt when that file changes, so range queries never build a figure.
+DATA_DIR = os.environ.get('DATA_DIR', os.path.join(tempfile.gettempdir(), 'release-scheduler'))
+LATEST_UPLOAD_PATH = os.path.join(DATA_DIR, 'latest_upload.jsonl')
+
+_query_index = None
+_query_index_lock = threading.Lock()
+_snapshot_lock = threading.Lock()
+_snapshot_pending = None  # (scheduler store, tickets store) waiting to be written
+_snapshot_writer = None
+
+class TimelineIndex:
+    """Rows of a frame sorted by start and by end for binary-search range queries"""
+    
+    def __init__(self, df, start_col, end_col):
+        self.df = df.dropna(subset=[start_col, end_col]).reset_index(drop=True)
+        self.starts = self.df[start_col].values.astype('datetime64[ns]')
+        self.ends = self.df[end_col].values.astype('datetime64[ns]')
+        self.start_order = np.argsort(self.starts, kind='stable')
+        self.end_order = np.argsort(self.ends, kind='stable')
+        self.sorted_starts = self.starts[self.start_order]
+        self.sorted_ends = self.ends[self.end_order]
+    
+    def overlapping(self, start=None, end=None):
+        """Rows whose [start, end] interval intersects the query range"""
+        start = pd.Timestamp(start).to_datetime64() if start is not None else None
+        end = pd.Timestamp(end).to_datetime64() if end is not None else None
+        n = len(self.df)
+        # Rows starting on/before `end` are a prefix of the start order, rows
+        # ending on/after `start` a suffix of the end order; scan the smaller one
+        n_started = np.searchsorted(self.sorted_starts, end, side='right') if end is not None else n
+        first_ended = np.searchsorted(self.sorted_ends, start, side='left') if start is not None else 0
+        if n_started <= n - first_ended:
+            rows = self.start_order[:n_started]
+            if start is not None:
+                rows = rows[self.ends[rows] >= start]
+        else:
+            rows = self.end_order[first_ended:]
+            if end is not None:
+                rows = rows[self.starts[rows] <= end]
+        return self.df.iloc[np.sort(rows)]
+
+class QueryIndex:
+    """Processed schedules, tickets and openings for one pair of uploads"""
+    
+    def __init__(self, stored_data, tickets_data, version=None):
+        self.version = version
+        df = load_frame(stored_data)
+        calendar = build_business_calendar(df)
+        scheduler_df = process_scheduler_data(df, end_date=None, calendar=calendar)
+        self.schedules = TimelineIndex(scheduler_df, 'Start Date', 'End Date')
+        self.schedules_by_goal = {
+            goal: TimelineIndex(goal_df, 'Start Date', 'End Date')
+            for goal, goal_df in scheduler_df.groupby('Goal')
+        }
+        self.openings = compute_next_openings(scheduler_df, calendar)
+        tickets_df = process_tickets_data(load_frame(tickets_data)) if tickets_data else pd.DataFrame()
+        self.tickets = TimelineIndex(tickets_df, 'RequestedDate', 'DueDate') if not tickets_df.empty else None
+
+def save_latest_upload(stored_data, tickets_data):
+    """Queue one session's stores to replace the upload served by the query API (never blocks)"""
+    global _snapshot_pending, _snapshot_writer
+    if not stored_data:
+        return
+    with _snapshot_lock:
+        if _snapshot_writer is None:
+            _snapshot_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix='snapshot')
+        # Latest upload wins: a write that has not started yet picks up these stores
+        queued = _snapshot_pending is not None
+        _snapshot_pending = (stored_data, tickets_data)
+    if not queued:
+        _snapshot_writer.submit(write_latest_upload)
+
+def write_latest_upload():
+    """Atomically replace the snapshot file with the pending stores (runs in the writer thread)"""
+    global _snapshot_pending
+    with _snapshot_lock:
+        stored_data, tickets_data = _snapshot_pending
+        _snapshot_pending = None
+    try:
+        os.makedirs(DATA_DIR, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=DATA_DIR, prefix='.latest_upload-', suffix='.jsonl')
+        try:
+            # Store values are single-line JSON documents, so they are written unchanged
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(stored_data)
+                f.write('\n')
+                f.write(tickets_data or 'null')
+                f.write('\n')
+            os.replace(tmp_path, LATEST_UPLOAD_PATH)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except Exception as e:
+        print(f"ERROR in write_latest_upload: {e}")
+
+def get_query_index():
+    """QueryIndex for the saved latest upload, reloaded when the file changes"""
+    global _query_index
+    try:
+        stat = os.stat(LATEST_UPLOAD_PATH)
+    except FileNotFoundError:
+        return None
+    version = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+    with _query_index_lock:
+        if _query_index is None or _query_index.version != version:
+            with open(LATEST_UPLOAD_PATH, encoding='utf-8') as f:
+                stored_data = f.readline().rstrip('\n')
+                tickets_data = f.readline().rstrip('\n')
+            if tickets_data in ('', 'null'):
+                tickets_data = None
+            _query_index = QueryIndex(stored_data, tickets_data, version)
+        return _query_index
+
+def schedule_records(df):
+    df = df[['Goal', 'Schedule', 'Start Date', 'End Date', 'Duration Days', 'Is_FTO_Workload']].rename(columns={
+        'Goal': 'goal', 'Schedule': 'schedule', 'Start Date': 'start', 'End Date': 'end',
+        'Duration Days': 'duration_days', 'Is_FTO_Workload': 'fto_workload'
+    })
+    return json.loads(df.to_json(orient='records', date_format='iso'))
+
+def ticket_records(df):
+    df = df.rename(columns={
+        'Assignee': 'assignee', 'Assignee Initials': 'initials', 'ID': 'id', 'Title': 'title',
+        'RequestedDate': 'requested', 'DueDate': 'due', 'TicketStatus': 'status'
+    })
+    return json.loads(df.to_json(orient='records', date_format='iso'))
+
+def api_error(message, status):
+    return flask.jsonify({'error': message}), status
+
+def parse_query_time(value):
+    """Timestamp from a query parameter, as naive UTC like the indexed data"""
+    timestamp = pd.Timestamp(value)
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.tz_convert('UTC').tz_localize(None)
+    return timestamp
+
+def query_range():
+    """Parse the start/end query parameters (ValueError if invalid)"""
+    start = flask.request.args.get('start')
+    end = flask.request.args.get('end')
+    try:
+        start = parse_query_time(start) if start else None
+        end = parse_query_time(end) if end else None
+    except (TypeError, ValueError) as e:
+        raise ValueError(f'Invalid date: {e}')
+    if start is not None and end is not None and start > end:
+        raise ValueError('start must not be after end')
+    return start, end
+
+@app.server.route('/api/schedules')
+def api_schedules():
+    """Schedules per goal, optionally limited by ?goal= and a ?start=/&end= range"""
+    index = get_query_index()
+    if index is None:
+        return api_error('No scheduler data uploaded yet', 404)
+    try:
+        start, end = query_range()
+    except ValueError as e:
+        return api_error(str(e), 400)
+    
+    goal = flask.request.args.get('goal')
+    if goal:
+        if goal not in index.schedules_by_goal:
+            return api_error(f'Unknown goal: {goal}', 404)
+        goals = [goal]
+    else:
+        goals = sorted(index.schedules_by_goal)
+    
+    return flask.jsonify({g: schedule_records(index.schedules_by_goal[g].overlapping(start, end)) for g in goals})
+
+@app.server.route('/api/active')
+def api_active():
+    """Schedules and tickets active between ?start= and ?end= (default: today)"""
+    index = get_query_index()
+    if index is None:
+        return api_error('No scheduler data uploaded yet', 404)
+    try:
+        start, end = query_range()
+    except ValueError as e:
+        return api_error(str(e), 400)
+    if start is None and end is None:
+        start = end = pd.Timestamp.today().normalize()
+    
+    tickets = ticket_records(index.tickets.overlapping(start, end)) if index.tickets else []
+    return flask.jsonify({
+        'schedules': schedule_records(index.schedules.overlapping(start, end)),
+        'tickets': tickets
+    })
+
+@app.server.route('/api/openings')
+def api_openings():
+    """Eligible goals ordered by next opening date (?limit=3 for the top 3)"""
+    index = get_query_index()
+    if index is None:
+        return api_error('No scheduler data uploaded yet', 404)
+    
+    openings = index.openings
+    limit = flask.request.args.get('limit')
+    if limit is not None:
+        if not limit.isdigit() or int(limit) < 1:
+            return api_error('limit must be a positive integer', 400)
+        openings = openings.head(int(limit))
+    return flask.jsonify([
+        {'goal': goal, 'opening_date': opening_date.isoformat()}
+        for goal, opening_date in openings.items()
+    ])
+
 app.layout = html.Div([
     html.H1("Release Scheduler — Interactive Timeline", style={'textAlign': 'center', 'marginBottom': 10}),
-    html.P("Organized by Goal and Schedule (Company Holidays Excluded)", 
+    html.P("Organized by Goal and Schedule (Company Holidays Excluded, Durations in Working Days)", 
            style={'textAlign': 'center', 'color': '#7f8c8d', 'marginBottom': 30}),
     
     dcc.Store(id='scheduler-data-store'),
@@ -456,6 +1129,15 @@ app.layout = html.Div([
             html.Button('Expand All', id='expand-all-btn', n_clicks=0, style={'marginRight': 10, 'padding': '5px 10px'}),
             html.Button('Collapse All', id='collapse-all-btn', n_clicks=0, style={'padding': '5px 10px'})
         ], style={'marginBottom': 15}),
+        html.Div([
+            html.Label('Tickets:', style={'fontWeight': 'bold', 'marginRight': 10}),
+            dcc.Checklist(
+                id='ticket-lanes-toggle',
+                options=[{'label': ' Pack into shared lanes (details on hover)', 'value': 'pack'}],
+                value=[],
+                style={'display': 'inline-block'}
+            )
+        ], style={'marginBottom': 15}),
 
 
     ], style={'padding': 15, 'backgroundColor': '#f8f9fa', 'borderRadius': 5}),
@@ -482,63 +1164,15 @@ def update_next_openings(stored_data):
         return (html.Div("Upload AHA schedules to see next openings.", style={'textAlign': 'center', 'color': '#7f8c8d', 'fontSize': 14}),
                 [])
     try:
-        df = pd.read_json(stored_data, orient='split')
-        scheduler_df = process_scheduler_data(df, end_date=None)
+        df = load_frame(stored_data)
+        calendar = build_business_calendar(df)
+        scheduler_df = process_scheduler_data(df, end_date=None, calendar=calendar)
         
         # Get next openings HTML display
-        display = get_next_openings(scheduler_df)
+        display = get_next_openings(scheduler_df, calendar)
         
         # Extract the goal names from top 3
-        if scheduler_df.empty:
-            return display, []
-        
-        # Exclude FTO & Workload schedules completely from planning
-        working_schedules = scheduler_df[scheduler_df['Is_FTO_Workload'] == False].copy()
-        
-        if working_schedules.empty:
-            return display, []
-        
-        # Separate remaining PTO/FTO from other schedules
-        pto_schedules = working_schedules[working_schedules['Schedule'].str.contains('FTO', na=False)].copy()
-        non_pto_schedules = working_schedules[~working_schedules['Schedule'].str.contains('FTO', na=False)].copy()
-        
-        # Get latest end date for each goal from NON-PTO schedules only
-        goal_last_dates = non_pto_schedules.groupby('Goal')['End Date'].max()
-        
-        # Calculate openings: 2 days after last non-PTO schedule
-        adjusted_openings = {}
-        for goal, last_date in goal_last_dates.items():
-            opening_date = last_date + pd.Timedelta(days=2)
-            
-            # Check if opening date falls within any PTO period
-            if not pto_schedules.empty:
-                goal_pto = pto_schedules[pto_schedules['Goal'] == goal].copy()
-                
-                for _, pto_row in goal_pto.iterrows():
-                    pto_start = pto_row['Start Date']
-                    pto_end = pto_row['End Date']
-                    pto_duration = (pto_end - pto_start).days
-                    
-                    # If opening falls within PTO and PTO is > 3 days, push past it
-                    if opening_date >= pto_start and opening_date <= pto_end:
-                        if pto_duration > 3:
-                            opening_date = pto_end + pd.Timedelta(days=1)
-            
-            adjusted_openings[goal] = opening_date
-        
-        # Convert to Series and sort
-        goal_openings_series = pd.Series(adjusted_openings)
-        goal_openings_series = goal_openings_series.sort_values()
-        
-        # Filter out excluded ones
-        excluded = {'AR', 'SD', 'RR', 'BW'}
-        filtered_openings = goal_openings_series[[g.replace('I-', '') not in excluded for g in goal_openings_series.index]]
-        
-        if len(filtered_openings) == 0:
-            return display, []
-        
-        # Get top 3 from eligible people and extract goal names
-        top_3_goals = filtered_openings.head(3).index.tolist()
+        top_3_goals = compute_next_openings(scheduler_df, calendar).head(3).index.tolist()
         
         return display, top_3_goals
     except Exception as e:
@@ -549,16 +1183,15 @@ def update_next_openings(stored_data):
      Output('tickets-upload-status', 'children')],
     Input('upload-tickets-data', 'contents'),
     State('upload-tickets-data', 'filename'),
+    State('scheduler-data-store', 'data'),
     prevent_initial_call=True
 )
-def update_tickets_data(contents, filename):
+def update_tickets_data(contents, filename, stored_data):
     if contents is None:
         raise dash.exceptions.PreventUpdate
     
     try:
-        content_type, content_string = contents.split(',')
-        decoded = base64.b64decode(content_string)
-        df_new = pd.read_csv(io.StringIO(decoded.decode('utf-8')))
+        df_new, size_note = read_uploaded_csv(contents)
         
         required_cols = ['Assignee', 'Due date', 'Subject', 'Status', 'ID', 'Requested']
         optional_cols = []
@@ -567,7 +1200,9 @@ def update_tickets_data(contents, filename):
         # Note: Requested column is required (Requested = Start date, Due date = End date)
         
         json_data = df_new.to_json(date_format='iso', orient='split')
-        status_msg = f'✓ Loaded {len(df_new)} tickets from {filename}'
+        status_msg = f'✓ Loaded {len(df_new)} tickets from {filename}{size_note}'
+        schedule_prerender(stored_data, json_data)
+        save_latest_upload(stored_data, json_data)
         return json_data, status_msg
     
     except Exception as e:
@@ -579,27 +1214,28 @@ def update_tickets_data(contents, filename):
      Output('goal-filter-dropdown', 'options')],
     Input('upload-aha-data', 'contents'),
     State('upload-aha-data', 'filename'),
+    State('tickets-data-store', 'data'),
     prevent_initial_call=True
 )
-def update_scheduler_data(contents, filename):
+def update_scheduler_data(contents, filename, tickets_data):
     if contents is None:
         raise dash.exceptions.PreventUpdate
     
     try:
-        content_type, content_string = contents.split(',')
-        decoded = base64.b64decode(content_string)
-        df_new = pd.read_csv(io.StringIO(decoded.decode('utf-8')))
+        df_new, size_note = read_uploaded_csv(contents)
         
         required_cols = ['Goal name', 'Schedule name', 'Schedule phase start', 'Schedule phase end']
         if not all(col in df_new.columns for col in required_cols):
             return None, f'❌ Error: Missing required columns', []
         
         json_data = df_new.to_json(date_format='iso', orient='split')
-        status_msg = f'✓ Loaded {len(df_new)} records from {filename}'
+        status_msg = f'✓ Loaded {len(df_new)} records from {filename}{size_note}'
         
         goals = sorted(df_new['Goal name'].unique())
         goal_options = [{'label': 'All Goals', 'value': 'All'}] + [{'label': g.replace('I-', ''), 'value': g} for g in goals]
         
+        schedule_prerender(json_data, tickets_data)
+        save_latest_upload(json_data, tickets_data)
         return json_data, status_msg, goal_options
     
     except Exception as e:
@@ -613,7 +1249,7 @@ def update_scheduler_data(contents, filename):
 def init_goal_filter(stored_data):
     """Initialize filter dropdown on page load"""
     if stored_data:
-        df = pd.read_json(stored_data, orient='split')
+        df = load_frame(stored_data)
     elif not default_df.empty:
         df = default_df.copy()
     else:
@@ -631,7 +1267,7 @@ def init_goal_filter(stored_data):
 def init_visible_goals(stored_data):
     """Initialize visible goals to all goals when data loads"""
     if stored_data:
-        df = pd.read_json(stored_data, orient='split')
+        df = load_frame(stored_data)
     elif not default_df.empty:
         df = default_df.copy()
     else:
@@ -640,6 +1276,84 @@ def init_visible_goals(stored_data):
     all_goals = sorted(df['Goal name'].unique())
     return {g: True for g in all_goals}
 
+def render_chart(stored_data, selected_goal, visible_goals, expanded_goals, tickets_data, pack_tickets=False):
+    """Build the serialized figure, stats and toggle buttons for one chart state"""
+    if stored_data:
+        df = load_frame(stored_data)
+    elif not default_df.empty:
+        df = default_df.copy()
+    else:
+        return go.Figure().add_annotation(text='No data').to_dict(), html.Div(), html.Div()
+    
+    calendar = build_business_calendar(df)
+    scheduler_df = process_scheduler_data(df, end_date='2027-01-31', calendar=calendar)
+    
+    # Process tickets
+    tickets_df = pd.DataFrame()
+    if tickets_data:
+        tickets_df_raw = load_frame(tickets_data)
+        tickets_df = process_tickets_data(tickets_df_raw)
+    
+    if selected_goal and selected_goal != 'All':
+        scheduler_df = scheduler_df[scheduler_df['Goal'] == selected_goal]
+    
+    if scheduler_df.empty:
+        return go.Figure().add_annotation(text='No data').to_dict(), html.Div(), html.Div()
+    
+    # Convert visible_goals dict to set for filtering in chart
+    if isinstance(visible_goals, dict):
+        visible_goals_set = set([g for g, v in visible_goals.items() if v])
+    else:
+        visible_goals_set = set(scheduler_df['Goal'].unique())
+    
+    if not visible_goals_set:
+        visible_goals_set = set(scheduler_df['Goal'].unique())
+    
+    fig = create_gantt_chart(scheduler_df, expanded_goals or {}, visible_goals_set, '2026-05-31', tickets_df, pack_tickets)
+    
+    total_schedules = len(scheduler_df)
+    total_goals = len(scheduler_df['Goal'].unique())
+    earliest_start = scheduler_df['Start Date'].min().strftime('%Y-%m-%d')
+    latest_end = scheduler_df['End Date'].max().strftime('%Y-%m-%d')
+    overall_duration = np.busday_count(
+        np.datetime64(scheduler_df['Start Date'].min(), 'D'), np.datetime64(scheduler_df['End Date'].max(), 'D'),
+        busdaycal=calendar
+    )
+    avg_duration = scheduler_df['Duration Days'].mean()
+    
+    stats = html.Div([
+        html.Span(f"📊 Schedules: {total_schedules}  |  "),
+        html.Span(f"🎯 Goals: {total_goals}  |  "),
+        html.Span(f"📅 {earliest_start} → {latest_end}  |  "),
+        html.Span(f"⏱️ {overall_duration} working days overall  |  "),
+        html.Span(f"📈 Avg: {avg_duration:.0f} working days"),
+    ], style={'fontSize': 13, 'color': '#2c3e50'})
+    
+    unique_goals = sorted(scheduler_df['Goal'].unique())
+    toggle_buttons = []
+    for goal in unique_goals:
+        is_expanded = expanded_goals.get(goal, True) if expanded_goals else True
+        label = f"{'▼' if is_expanded else '▶'} {goal.replace('I-', '')}"
+        toggle_buttons.append(
+            html.Button(
+                label,
+                id={'type': 'goal-toggle-btn', 'index': goal},
+                n_clicks=0,
+                style={
+                    'marginRight': 8,
+                    'marginBottom': 8,
+                    'padding': '8px 12px',
+                    'backgroundColor': '#e8f4f8',
+                    'border': '1px solid #5DADE2',
+                    'borderRadius': '4px',
+                    'cursor': 'pointer',
+                    'fontWeight': 'bold'
+                }
+            )
+        )
+    
+    return fig.to_dict(), stats, html.Div(toggle_buttons, style={'display': 'flex', 'flexWrap': 'wrap', 'gap': '8px'})
+
 @callback(
     [Output('gantt-chart', 'figure'),
      Output('scheduler-stats', 'children'),
@@ -648,85 +1362,23 @@ def init_visible_goals(stored_data):
      Input('goal-filter-dropdown', 'value'),
      Input('visible-goals-store', 'data'),
      Input('expanded-goals-store', 'data'),
-     Input('tickets-data-store', 'data')],
+     Input('tickets-data-store', 'data'),
+     Input('ticket-lanes-toggle', 'value')],
     prevent_initial_call=False
 )
-def update_chart(stored_data, selected_goal, visible_goals, expanded_goals, tickets_data):
+def update_chart(stored_data, selected_goal, visible_goals, expanded_goals, tickets_data, ticket_lanes):
+    pack_tickets = 'pack' in (ticket_lanes or [])
+    key = chart_cache_key(stored_data, selected_goal, visible_goals, expanded_goals, tickets_data, pack_tickets)
+    cached = figure_cache_get(key)
+    if cached is not None:
+        return cached
+    
     try:
-        if stored_data:
-            df = pd.read_json(stored_data, orient='split')
-        elif not default_df.empty:
-            df = default_df.copy()
-        else:
-            return go.Figure().add_annotation(text='No data'), html.Div(), html.Div()
-        
-        scheduler_df = process_scheduler_data(df, end_date='2027-01-31')
-        
-        # Process tickets
-        tickets_df = pd.DataFrame()
-        if tickets_data:
-            tickets_df_raw = pd.read_json(tickets_data, orient='split')
-            tickets_df = process_tickets_data(tickets_df_raw)
-        
-        if selected_goal and selected_goal != 'All':
-            scheduler_df = scheduler_df[scheduler_df['Goal'] == selected_goal]
-        
-        if scheduler_df.empty:
-            return go.Figure().add_annotation(text='No data'), html.Div(), html.Div()
-        
-        # Convert visible_goals dict to set for filtering in chart
-        if isinstance(visible_goals, dict):
-            visible_goals_set = set([g for g, v in visible_goals.items() if v])
-        else:
-            visible_goals_set = set(scheduler_df['Goal'].unique())
-        
-        if not visible_goals_set:
-            visible_goals_set = set(scheduler_df['Goal'].unique())
-        
-        fig = create_gantt_chart(scheduler_df, expanded_goals or {}, visible_goals_set, '2026-05-31', tickets_df)
-        
-        total_schedules = len(scheduler_df)
-        total_goals = len(scheduler_df['Goal'].unique())
-        earliest_start = scheduler_df['Start Date'].min().strftime('%Y-%m-%d')
-        latest_end = scheduler_df['End Date'].max().strftime('%Y-%m-%d')
-        overall_duration = (scheduler_df['End Date'].max() - scheduler_df['Start Date'].min()).days
-        avg_duration = scheduler_df['Duration Days'].mean()
-        
-        stats = html.Div([
-            html.Span(f"📊 Schedules: {total_schedules}  |  "),
-            html.Span(f"🎯 Goals: {total_goals}  |  "),
-            html.Span(f"📅 {earliest_start} → {latest_end}  |  "),
-            html.Span(f"⏱️ {overall_duration} days overall  |  "),
-            html.Span(f"📈 Avg: {avg_duration:.0f} days"),
-        ], style={'fontSize': 13, 'color': '#2c3e50'})
-        
-        unique_goals = sorted(scheduler_df['Goal'].unique())
-        toggle_buttons = []
-        for goal in unique_goals:
-            is_expanded = expanded_goals.get(goal, True) if expanded_goals else True
-            label = f"{'▼' if is_expanded else '▶'} {goal.replace('I-', '')}"
-            toggle_buttons.append(
-                html.Button(
-                    label,
-                    id={'type': 'goal-toggle-btn', 'index': goal},
-                    n_clicks=0,
-                    style={
-                        'marginRight': 8,
-                        'marginBottom': 8,
-                        'padding': '8px 12px',
-                        'backgroundColor': '#e8f4f8',
-                        'border': '1px solid #5DADE2',
-                        'borderRadius': '4px',
-                        'cursor': 'pointer',
-                        'fontWeight': 'bold'
-                    }
-                )
-            )
-        
-        return fig, stats, html.Div(toggle_buttons, style={'display': 'flex', 'flexWrap': 'wrap', 'gap': '8px'})
+        result = render_chart(stored_data, selected_goal, visible_goals, expanded_goals, tickets_data, pack_tickets)
+        figure_cache_put(key, result)
+        return result
     
     except Exception as e:
-        import traceback
         print(f"ERROR in update_chart: {e}")
         print(traceback.format_exc())
         return go.Figure().add_annotation(text=f'Error: {str(e)}'), html.Div(f'Error: {e}'), html.Div()
@@ -775,7 +1427,7 @@ def expand_all(n_clicks, stored_data):
     if n_clicks == 0:
         raise dash.exceptions.PreventUpdate
     
-    df = pd.read_json(stored_data, orient='split') if stored_data else default_df.copy()
+    df = load_frame(stored_data) if stored_data else default_df.copy()
     return {g: True for g in sorted(df['Goal name'].unique())}
 
 @callback(
@@ -788,10 +1440,76 @@ def collapse_all(n_clicks, stored_data):
     if n_clicks == 0:
         raise dash.exceptions.PreventUpdate
     
-    df = pd.read_json(stored_data, orient='split') if stored_data else default_df.copy()
+    df = load_frame(stored_data) if stored_data else default_df.copy()
     return {g: False for g in sorted(df['Goal name'].unique())}
 
+# Startup
+# warm_up runs the processing and figure pipeline once on a tiny built-in sample
+# so lazy imports and first-call setup happen before the first real request.
+# Under gunicorn it runs in the master when preloading (workers fork from the
+# warmed copy), otherwise in each worker before it serves; see gunicorn.conf.py.
+WARMUP_AHA_CSV = """Goal name,Schedule name,Schedule phase name,Schedule phase start,Schedule phase end
+I-AN,Release 1,Build,2025-08-04,2025-08-29
+I-AN,Release 1,Validate,2025-09-01,2025-09-19
+I-AN,AN FTO & Workload,FTO - vacation,2025-09-22,2025-09-26
+I-JS,Release 2,Build,2025-08-11,2025-10-03
+I-JS,Release 2 FTO,FTO,2025-10-06,2025-10-17
+Company,Company Holidays,Labor Day,2025-09-01,2025-09-01
+"""
+
+WARMUP_TICKETS_CSV = """ID,Subject,Assignee,Status,Requested,Due date
+101,Warm-up request,Ann Nguyen,Open,2025-08-05,2025-08-12
+102,Warm-up follow-up,Ann Nguyen,Pending,2025-08-07,2025-08-20
+103,Warm-up review,Jo Smith,On-hold,2025-09-02,2025-09-09
+"""
+
+STARTUP_STATS = {'import_seconds': None, 'warmup_seconds': None, 'warmed_pid': None}
+
+def warm_up():
+    """Exercise upload parsing, processing, openings, figures and serialization once"""
+    from plotly.io.json import to_json_plotly
+    
+    started = time.perf_counter()
+    stored_data = pd.read_csv(io.StringIO(WARMUP_AHA_CSV)).to_json(date_format='iso', orient='split')
+    tickets_data = pd.read_csv(io.StringIO(WARMUP_TICKETS_CSV)).to_json(date_format='iso', orient='split')
+    
+    df = load_frame(stored_data)
+    calendar = build_business_calendar(df)
+    scheduler_df = process_scheduler_data(df, end_date=None, calendar=calendar)
+    to_json_plotly(get_next_openings(scheduler_df, calendar))
+    
+    goals = sorted(scheduler_df['Goal'].unique())
+    for pack_tickets in (False, True):
+        result = render_chart(stored_data, 'All', {g: True for g in goals}, {}, tickets_data, pack_tickets)
+        to_json_plotly(result)
+    
+    # Layout and dependency routes, as hit by the first page load
+    client = app.server.test_client()
+    for path in ('/', '/_dash-layout', '/_dash-dependencies'):
+        client.get(path)
+    
+    # Leave the dataset cache as it was
+    with _cache_lock:
+        for data in (stored_data, tickets_data):
+            _dataset_cache.pop(data_key(data), None)
+    
+    STARTUP_STATS['warmup_seconds'] = time.perf_counter() - started
+    STARTUP_STATS['warmed_pid'] = os.getpid()
+    print(f"Warm-up finished in {STARTUP_STATS['warmup_seconds']:.2f}s (pid {os.getpid()})")
+
+@app.server.route('/_diagnostics/startup')
+def startup_diagnostics():
+    """Import and warm-up timings; warmed_in_parent is True for preloaded, forked workers"""
+    return flask.jsonify(dict(
+        STARTUP_STATS,
+        pid=os.getpid(),
+        warmed_in_parent=STARTUP_STATS['warmed_pid'] not in (None, os.getpid()),
+        plotly_loaded='plotly.graph_objects' in sys.modules
+    ))
+
 if __name__ == '__main__':
+    if os.environ.get('WARMUP', '1') == '1':
+        warm_up()
     app.run_server(debug=False, host='127.0.0.1', port=8052)
 
 # Expose Flask server for gunicorn
@@ -812,3 +1530,5 @@ def auto_collapse_non_top_openings(next_openings_goals):
     # Create expanded state: True only for next openings goals
     expanded_state = {goal: True for goal in next_openings_goals}
     return expanded_state
+
+STARTUP_STATS['import_seconds'] = time.perf_counter() - _IMPORT_STARTED